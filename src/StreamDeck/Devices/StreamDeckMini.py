@@ -32,7 +32,7 @@ class StreamDeckMini(StreamDeck):
     IMAGE_REPORT_PAYLOAD_LENGTH = IMAGE_REPORT_LENGTH - IMAGE_REPORT_HEADER_LENGTH
 
     # 80 x 80 black BMP
-    BLANK_KEY_IMAGE = [
+    BLANK_KEY_IMAGE = bytes([
         0x42, 0x4d, 0xf6, 0x3c, 0x00, 0x00, 0x00, 0x00,
         0x00, 0x00, 0x36, 0x00, 0x00, 0x00, 0x28, 0x00,
         0x00, 0x00, 0x48, 0x00, 0x00, 0x00, 0x48, 0x00,
@@ -40,7 +40,7 @@ class StreamDeckMini(StreamDeck):
         0x00, 0x00, 0xc0, 0x3c, 0x00, 0x00, 0xc4, 0x0e,
         0x00, 0x00, 0xc4, 0x0e, 0x00, 0x00, 0x00, 0x00,
         0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-    ] + [0] * (KEY_PIXEL_WIDTH * KEY_PIXEL_HEIGHT * 3)
+    ] + [0] * (KEY_PIXEL_WIDTH * KEY_PIXEL_HEIGHT * 3))
 
     def _read_control_states(self):
         states = self.device.read(1 + self.KEY_COUNT)
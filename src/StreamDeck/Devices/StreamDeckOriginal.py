@@ -30,7 +30,7 @@ class StreamDeckOriginal(StreamDeck):
     IMAGE_REPORT_HEADER_LENGTH = 16
 
     # 72 x 72 black BMP
-    BLANK_KEY_IMAGE = [
+    BLANK_KEY_IMAGE = bytes([
         0x42, 0x4d, 0xf6, 0x3c, 0x00, 0x00, 0x00, 0x00,
         0x00, 0x00, 0x36, 0x00, 0x00, 0x00, 0x28, 0x00,
         0x00, 0x00, 0x48, 0x00, 0x00, 0x00, 0x48, 0x00,
@@ -38,7 +38,7 @@ class StreamDeckOriginal(StreamDeck):
         0x00, 0x00, 0xc0, 0x3c, 0x00, 0x00, 0xc4, 0x0e,
         0x00, 0x00, 0xc4, 0x0e, 0x00, 0x00, 0x00, 0x00,
         0x00, 0x00, 0x00, 0x00, 0x00, 0x00
-    ] + [0] * (KEY_PIXEL_WIDTH * KEY_PIXEL_HEIGHT * 3)
+    ] + [0] * (KEY_PIXEL_WIDTH * KEY_PIXEL_HEIGHT * 3))
 
     def _convert_key_id_origin(self, key):
         key_col = key % self.KEY_COLS
@@ -54,7 +54,7 @@ class StreamDeckPlus(StreamDeck):
     }
 
     # 120 x 120 black JPEG
-    BLANK_KEY_IMAGE = [
+    BLANK_KEY_IMAGE = bytes([
         0xff, 0xd8, 0xff, 0xe0, 0x00, 0x10, 0x4a, 0x46, 0x49, 0x46, 0x00,
         0x01, 0x01, 0x00, 0x00, 0x01, 0x00, 0x01, 0x00, 0x00, 0xff, 0xdb,
         0x00, 0x43, 0x00, 0x08, 0x06, 0x06, 0x07, 0x06, 0x05, 0x08, 0x07,
@@ -136,10 +136,10 @@ class StreamDeckPlus(StreamDeck):
         0x28, 0xa0, 0x02, 0x8a, 0x28, 0xa0, 0x02, 0x8a, 0x28, 0xa0, 0x02,
         0x8a, 0x28, 0xa0, 0x02, 0x8a, 0x28, 0xa0, 0x02, 0x8a, 0x28, 0xa0,
         0x0f, 0xff, 0xd9
-    ]
+    ])
 
     # 120 x 800 black JPEG
-    BLANK_TOUCHSCREEN_IMAGE = [
+    BLANK_TOUCHSCREEN_IMAGE = bytes([
         0xff, 0xd8, 0xff, 0xe0, 0x00, 0x10, 0x4a, 0x46, 0x49, 0x46, 0x00,
         0x01, 0x01, 0x00, 0x00, 0x01, 0x00, 0x01, 0x00, 0x00, 0xff, 0xdb,
         0x00, 0x43, 0x00, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01, 0x01,
@@ -325,7 +325,7 @@ class StreamDeckPlus(StreamDeck):
         0x0a, 0x28, 0xa2, 0x80, 0x0a, 0x28, 0xa2, 0x80, 0x0a, 0x28, 0xa2,
         0x80, 0x0a, 0x28, 0xa2, 0x80, 0x0a, 0x28, 0xa2, 0x80, 0x0a, 0x28,
         0xa2, 0x80, 0x3f, 0xff, 0xd9
-    ]
+    ])
 
     def _reset_key_stream(self):
         payload = bytearray(self._IMG_PACKET_LEN)
@@ -25,6 +25,10 @@ class LibUSBHIDAPI(Transport):
         HIDAPI_INSTANCE = None
         HOMEBREW_PREFIX = None
 
+        # Upper bound (in seconds) on the `brew --prefix` lookup, so that a
+        # misbehaving Homebrew install cannot stall transport probing.
+        HOMEBREW_PROBE_TIMEOUT = 2
+
         def _get_homebrew_path(self):
             if self.platform_name != "Darwin":
                 return None
@@ -34,7 +38,7 @@ class LibUSBHIDAPI(Transport):
                 try:
                     import subprocess # nosec B404
 
-                    homebrew_path = subprocess.run(['brew', '--prefix'], stdout=subprocess.PIPE, text=True, check=True).stdout.strip() # nosec
+                    homebrew_path = subprocess.run(['brew', '--prefix'], stdout=subprocess.PIPE, text=True, check=True, timeout=self.HOMEBREW_PROBE_TIMEOUT).stdout.strip() # nosec
                 except: # nosec B110
                     pass
 
@@ -10,6 +10,7 @@
 # Example script showing basic library usage - updating key images with new
 # tiles generated at runtime, and responding to button state change events.
 
+import functools
 import os
 import threading
 
@@ -21,6 +22,17 @@ from StreamDeck.Transport.Transport import TransportError
 # Folder location of image assets used by this example.
 ASSETS_PATH = os.path.join(os.path.dirname(__file__), "Assets")
 
+# Previously rendered key images in the deck's native format, keyed by deck
+# model and key style, so that repeated key presses skip the PIL rendering.
+KEY_IMAGE_CACHE = {}
+
+
+# Loads a TrueType font at the given size. Loaded fonts are kept for reuse, so
+# each font file is only read and parsed once.
+@functools.lru_cache(maxsize=None)
+def load_font(font_filename, size):
+    return ImageFont.truetype(font_filename, size)
+
 
 # Generates a custom tile with run-time generated text and custom image via the
 # PIL module.
@@ -34,7 +46,7 @@ def render_key_image(deck, icon_filename, font_filename, label_text):
     # Load a custom TrueType font and use it to overlay the key index, draw key
     # label onto the image a few pixels from the bottom of the key.
     draw = ImageDraw.Draw(image)
-    font = ImageFont.truetype(font_filename, 14)
+    font = load_font(font_filename, 14)
     draw.text((image.width / 2, image.height - 5), text=label_text, font=font, anchor="ms", fill="white")
 
     return PILHelper.to_native_key_format(deck, image)
@@ -70,8 +82,13 @@ def update_key_image(deck, key, state):
     # Determine what icon and label to use on the generated key.
     key_style = get_key_style(deck, key, state)
 
-    # Generate the custom key with the requested image and label.
-    image = render_key_image(deck, key_style["icon"], key_style["font"], key_style["label"])
+    # Generate the custom key with the requested image and label, reusing a
+    # previously rendered image if this style has already been drawn.
+    cache_key = (deck.deck_type(), key_style["icon"], key_style["font"], key_style["label"])
+    image = KEY_IMAGE_CACHE.get(cache_key)
+    if image is None:
+        image = render_key_image(deck, key_style["icon"], key_style["font"], key_style["label"])
+        KEY_IMAGE_CACHE[cache_key] = image
 
     # Use a scoped-with on the deck to ensure we're the only thread using it
     # right now.
@@ -37,6 +37,9 @@ img_byte_arr = io.BytesIO()
 img.save(img_byte_arr, format='JPEG')
 img_pressed_bytes = img_byte_arr.getvalue()
 
+# icon for the exit dial on the touch lcd
+exit_icon = Image.open(os.path.join(ASSETS_PATH, 'Exit.png')).resize((80, 80))
+
 
 # callback when buttons are pressed or released
 def key_change_callback(deck, key, key_state):
@@ -55,8 +58,7 @@ def dial_change_callback(deck, dial, event, value):
         else:
             # build an image for the touch lcd
             img = Image.new('RGB', (800, 100), 'black')
-            icon = Image.open(os.path.join(ASSETS_PATH, 'Exit.png')).resize((80, 80))
-            img.paste(icon, (690, 10), icon)
+            img.paste(exit_icon, (690, 10), exit_icon)
 
             for k in range(0, deck.DIAL_COUNT - 1):
                 img.paste(pressed_icon if (dial == k and value) else released_icon, (30 + (k * 220), 10),
@@ -115,8 +117,7 @@ if __name__ == "__main__":
 
         # build an image for the touch lcd
         img = Image.new('RGB', (800, 100), 'black')
-        icon = Image.open(os.path.join(ASSETS_PATH, 'Exit.png')).resize((80, 80))
-        img.paste(icon, (690, 10), icon)
+        img.paste(exit_icon, (690, 10), exit_icon)
 
         for dial in range(0, deck.DIAL_COUNT - 1):
             img.paste(released_icon, (30 + (dial * 220), 10), released_icon)